@@ -1,72 +1,156 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import NamedTuple, Sequence, Tuple
 
+import numpy as np
 import plotly.graph_objects as go
-from dash import Dash, Input, Output, dcc, html
+import plotly.io as pio
+from dash import ClientsideFunction, Dash, Input, Output, State, dcc, html
+from numba import float64, njit
 
 
-@dataclass(frozen=True)
-class AutomatonParameters:
+class AutomatonParameters(NamedTuple):
     s: float
     p_l_given_y: float
     p_y: float
     p_not_l_given_not_y: float
 
-    @property
-    def p_not_l_given_y(self) -> float:
-        return 1.0 - self.p_l_given_y
 
-    @property
-    def p_not_y(self) -> float:
-        return 1.0 - self.p_y
+def _derived_terms(
+    ply: float,
+    py: float,
+    pnotl_noty: float,
+) -> Tuple[float, float, float]:
+    """P(¬L|Y), P(¬Y) and the common bracket term B."""
+    pnoty = 1.0 - py
+    return 1.0 - ply, pnoty, ply * py + pnotl_noty * pnoty
 
-    @property
-    def base_term(self) -> float:
-        """Common bracket term appearing in the stationary distribution."""
-        return (
-            self.p_l_given_y * self.p_y
-            + self.p_not_l_given_not_y * self.p_not_y
-        )
 
+class StationaryResult(NamedTuple):
+    """Stationary distribution together with the derived values it used."""
 
-def stationary_distribution(params: AutomatonParameters) -> List[float]:
+    dist: Tuple[float, ...]
+    pnotly: float
+    pnoty: float
+    base: float
+
+
+def stationary_distribution(params: AutomatonParameters) -> StationaryResult:
     """
     Compute the stationary distribution for the eight-state literal automaton.
 
     The closed-form expressions are transcribed from the provided table where
     each πᵢ = α · P(Y)^{aᵢ} · P(¬L|Y)^{bᵢ} · P(L|Y)^{cᵢ} · s^{dᵢ} · B^{eᵢ}
     and B = P(L|Y)P(Y) + P(¬L|¬Y)P(¬Y). The normalising constant α ensures
-    that the probabilities sum to one.
+    that the probabilities sum to one. P(¬L|Y), P(¬Y) and B are returned
+    alongside the distribution so callers do not recompute them.
+    """
+    return _stationary_cached(
+        params.s,
+        params.p_l_given_y,
+        params.p_y,
+        params.p_not_l_given_not_y,
+    )
+
+
+# This memo is the only cache on the server path. dcc.Slider commits its
+# value on mouseup, so the callback runs once per release, not once per drag
+# tick, and tabulating a whole slider axis would cost more on each miss than
+# computing the released position directly.
+@lru_cache(maxsize=4096)
+def _stationary_cached(
+    s: float,
+    ply: float,
+    py: float,
+    pnotl_noty: float,
+) -> StationaryResult:
+    """
+    Memoised wrapper around :func:`_kernel` behind
+    :func:`stationary_distribution`.
+
+    The sliders move on a fixed grid, so released positions are often
+    revisited.
     """
-    s = params.s
-    py = params.p_y
-    ply = params.p_l_given_y
-    pnotly = params.p_not_l_given_y
-    base = params.base_term
-
-    terms = [
-        py**4 * pnotly**7,
-        py**3 * pnotly**6 * s * base,
-        py**2 * pnotly**5 * s**2 * base**2,
-        py * pnotly**4 * s**3 * base**3,
-        pnotly**3 * s**4 * base**4,
-        ply * pnotly**2 * s**5 * base**4,
-        ply**2 * pnotly * s**6 * base**4,
-        ply**3 * s**7 * base**4,
-    ]
-
-    total = sum(terms)
+    pnotly, pnoty, base = _derived_terms(ply, py, pnotl_noty)
+    dist = tuple(_kernel(s, py, ply, pnotly, base).tolist())
+    return StationaryResult(dist=dist, pnotly=pnotly, pnoty=pnoty, base=base)
+
+
+# An explicit signature compiles the kernel once, eagerly, at import. Dash
+# sends slider positions such as 10 or 0 as JSON integers, and a lazily
+# compiled dispatcher would JIT a fresh int/float specialisation for each
+# mix on first use; with the signature fixed they are cast to float64.
+@njit(
+    float64[::1](float64, float64, float64, float64, float64),
+    cache=True,
+    fastmath=True,
+)
+def _kernel(
+    s: float,
+    py: float,
+    ply: float,
+    pnotly: float,
+    base: float,
+) -> np.ndarray:
+    """Normalised eight-state distribution, compiled by Numba."""
+    # Small integer powers as explicit multiplication chains, so no term goes
+    # through libm's pow.
+    s2 = s * s
+    s3 = s2 * s
+    s4 = s2 * s2
+    b2 = base * base
+    b3 = b2 * base
+    b4 = b2 * b2
+
+    # The sliders reach 0 and 1, where whole groups of states vanish: π₁..π₄
+    # carry P(Y), π₆..π₈ carry P(L|Y) and π₁..π₇ carry P(¬L|Y). Those terms
+    # are left at zero instead of being multiplied out.
+    out = np.zeros(8)
+    if pnotly == 0.0:
+        out[7] = ply * ply * ply * s4 * s3 * b4
+    else:
+        pn2 = pnotly * pnotly
+        pn3 = pn2 * pnotly
+        out[4] = pn3 * s4 * b4
+        if py != 0.0:
+            py2 = py * py
+            py3 = py2 * py
+            py4 = py2 * py2
+            pn4 = pn2 * pn2
+            pn5 = pn4 * pnotly
+            pn6 = pn3 * pn3
+            pn7 = pn6 * pnotly
+            out[0] = py4 * pn7
+            out[1] = py3 * pn6 * s * base
+            out[2] = py2 * pn5 * s2 * b2
+            out[3] = py * pn4 * s3 * b3
+        if ply != 0.0:
+            s5 = s4 * s
+            s6 = s3 * s3
+            s7 = s6 * s
+            ply2 = ply * ply
+            ply3 = ply2 * ply
+            out[5] = ply * pn2 * s5 * b4
+            out[6] = ply2 * pnotly * s6 * b4
+            out[7] = ply3 * s7 * b4
+
+    total = 0.0
+    for i in range(8):
+        total += out[i]
+
     if total == 0:
         # Avoid division by zero; fallback to uniform distribution.
-        return [1.0 / len(terms)] * len(terms)
+        out[:] = 1.0 / 8
+        return out
 
     alpha = 1.0 / total
-    return [alpha * term for term in terms]
+    for i in range(8):
+        out[i] *= alpha
+    return out
 
 
-def create_figure(distribution: List[float]) -> go.Figure:
+def create_figure(distribution: Sequence[float]) -> go.Figure:
     states = [f"π{i}" for i in range(1, 9)]
     figure = go.Figure(
         data=[
@@ -89,16 +173,49 @@ def create_figure(distribution: List[float]) -> go.Figure:
     return figure
 
 
-def create_distribution_list(distribution: List[float]) -> html.Ul:
+def _format_state(index: int, value: float) -> str:
+    return f"π{index + 1} = {value:.6f}"
+
+
+def create_distribution_list(distribution: Sequence[float]) -> html.Ul:
     return html.Ul(
         [
-            html.Li(f"π{i + 1} = {value:.6f}")
+            html.Li(_format_state(i, value), id=f"pi-{i + 1}")
             for i, value in enumerate(distribution)
         ],
+        id="distribution-values",
         style={"columns": 2, "listStyleType": "none", "paddingLeft": 0},
     )
 
 
+def create_derived_params(result: StationaryResult) -> html.Div:
+    return html.Div(
+        [
+            html.Div(
+                f"P(¬L | Y) = {result.pnotly:.4f}, "
+                f"P(¬Y) = {result.pnoty:.4f}, "
+                f"B = {result.base:.4f}"
+            ),
+        ]
+    )
+
+
+# The figure, value list and derived parameters are rendered once from the
+# initial slider values; callbacks only update the numbers that change.
+_INITIAL_PARAMS = AutomatonParameters(
+    s=10.0,
+    p_l_given_y=0.5,
+    p_y=0.5,
+    p_not_l_given_not_y=0.5,
+)
+_INITIAL_RESULT = stationary_distribution(_INITIAL_PARAMS)
+_BASE_FIGURE = create_figure(_INITIAL_RESULT.dist)
+
+
+# Dash serialises the layout and every callback response with plotly.io's
+# JSON encoder. Pin it to orjson instead of relying on "auto" finding it.
+pio.json.config.default_engine = "orjson"
+
 app = Dash(__name__)
 app.title = "Literal Automaton Stationary Distribution"
 
@@ -117,7 +234,7 @@ app.layout = html.Div(
                     min=1.0,
                     max=25.0,
                     step=0.1,
-                    value=10.0,
+                    value=_INITIAL_PARAMS.s,
                     marks={1.0: "1", 10.0: "10", 25.0: "25"},
                     tooltip={"placement": "bottom", "always_visible": False},
                 ),
@@ -127,7 +244,7 @@ app.layout = html.Div(
                     min=0.0,
                     max=1.0,
                     step=0.01,
-                    value=0.5,
+                    value=_INITIAL_PARAMS.p_l_given_y,
                     marks={0.0: "0.0", 0.5: "0.5", 1.0: "1.0"},
                     tooltip={"placement": "bottom", "always_visible": False},
                 ),
@@ -137,7 +254,7 @@ app.layout = html.Div(
                     min=0.0,
                     max=1.0,
                     step=0.01,
-                    value=0.5,
+                    value=_INITIAL_PARAMS.p_y,
                     marks={0.0: "0.0", 0.5: "0.5", 1.0: "1.0"},
                     tooltip={"placement": "bottom", "always_visible": False},
                 ),
@@ -147,7 +264,7 @@ app.layout = html.Div(
                     min=0.0,
                     max=1.0,
                     step=0.01,
-                    value=0.5,
+                    value=_INITIAL_PARAMS.p_not_l_given_not_y,
                     marks={0.0: "0.0", 0.5: "0.5", 1.0: "1.0"},
                     tooltip={"placement": "bottom", "always_visible": False},
                 ),
@@ -156,9 +273,11 @@ app.layout = html.Div(
         ),
         html.Div(
             [
-                dcc.Graph(id="stationary-bar"),
-                html.Div(id="distribution-values"),
+                dcc.Graph(id="stationary-bar", figure=_BASE_FIGURE),
+                create_distribution_list(_INITIAL_RESULT.dist),
+                dcc.Store(id="dist-store"),
                 html.Div(
+                    create_derived_params(_INITIAL_RESULT),
                     id="derived-params",
                     style={"marginTop": "1rem", "fontFamily": "monospace"},
                 ),
@@ -169,14 +288,37 @@ app.layout = html.Div(
 )
 
 
-@app.callback(
+# The bar chart is recomputed in the browser by assets/automaton.js.
+app.clientside_callback(
+    ClientsideFunction(namespace="automaton", function_name="update"),
     Output("stationary-bar", "figure"),
-    Output("distribution-values", "children"),
+    Input("slider-s", "value"),
+    Input("slider-ply", "value"),
+    Input("slider-py", "value"),
+    Input("slider-pnotl-noty", "value"),
+    State("stationary-bar", "figure"),
+    prevent_initial_call=True,
+)
+
+
+# The value list is filled in from the stored distribution in the browser, so
+# the server only sends the eight numbers.
+app.clientside_callback(
+    ClientsideFunction(namespace="automaton", function_name="format_states"),
+    [Output(f"pi-{i}", "children") for i in range(1, 9)],
+    Input("dist-store", "data"),
+    prevent_initial_call=True,
+)
+
+
+@app.callback(
+    Output("dist-store", "data"),
     Output("derived-params", "children"),
     Input("slider-s", "value"),
     Input("slider-ply", "value"),
     Input("slider-py", "value"),
     Input("slider-pnotl-noty", "value"),
+    prevent_initial_call=True,
 )
 def update_visualisation(
     s: float,
@@ -190,19 +332,9 @@ def update_visualisation(
         p_y=p_y,
         p_not_l_given_not_y=p_not_l_given_not_y,
     )
-    distribution = stationary_distribution(params)
-    figure = create_figure(distribution)
-    distribution_list = create_distribution_list(distribution)
-    derived = html.Div(
-        [
-            html.Div(
-                f"P(¬L | Y) = {params.p_not_l_given_y:.4f}, "
-                f"P(¬Y) = {params.p_not_y:.4f}, "
-                f"B = {params.base_term:.4f}"
-            ),
-        ]
-    )
-    return figure, distribution_list, derived
+    result = stationary_distribution(params)
+
+    return result.dist, create_derived_params(result)
 
 
 if __name__ == "__main__":
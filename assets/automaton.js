@@ -0,0 +1,94 @@
+// Clientside callbacks for app.py: the bar chart and the value list labels.
+
+// Computation functions (ported from Python). stateCoefficients, normalise
+// and stationaryDistribution must stay in sync with the static page in
+// generate_static.py.
+
+// Buffers reused across updates
+const terms = new Float64Array(8);
+
+// Every term factors as coefficient[i] * s^i, where the coefficient
+// depends only on the three probabilities. Powers are written out as
+// multiplications rather than Math.pow calls.
+function stateCoefficients(py, ply, pnotl_noty, out) {
+    const pnotly = 1.0 - ply;
+    const pnoty = 1.0 - py;
+    const base = ply * py + pnotl_noty * pnoty;
+
+    const py2 = py * py;
+    const pn2 = pnotly * pnotly;
+    const pn3 = pn2 * pnotly;
+    const pn4 = pn2 * pn2;
+    const b2 = base * base;
+    const b4 = b2 * b2;
+
+    out[0] = py2 * py2 * pn4 * pn3;
+    out[1] = py2 * py * pn3 * pn3 * base;
+    out[2] = py2 * pn4 * pnotly * b2;
+    out[3] = py * pn4 * b2 * base;
+    out[4] = pn3 * b4;
+    out[5] = ply * pn2 * b4;
+    out[6] = ply * ply * pnotly * b4;
+    out[7] = ply * ply * ply * b4;
+}
+
+// Normalise buf[offset .. offset + 8) in place.
+function normalise(buf, offset) {
+    let total = 0;
+    for (let i = 0; i < 8; i++) {
+        total += buf[offset + i];
+    }
+
+    if (total === 0) {
+        for (let i = 0; i < 8; i++) {
+            buf[offset + i] = 1.0 / 8;
+        }
+        return;
+    }
+
+    const alpha = 1.0 / total;
+    for (let i = 0; i < 8; i++) {
+        buf[offset + i] *= alpha;
+    }
+}
+
+// Fills and returns the shared terms buffer.
+function stationaryDistribution(s, py, ply, pnotl_noty) {
+    stateCoefficients(py, ply, pnotl_noty, terms);
+    let sPower = 1.0;
+    for (let i = 0; i < 8; i++) {
+        terms[i] *= sPower;
+        sPower *= s;
+    }
+    normalise(terms, 0);
+    return terms;
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    automaton: {
+        update: function (s, ply, py, pnotl_noty, figure) {
+            const distribution = stationaryDistribution(s, py, ply, pnotl_noty);
+
+            let maxValue = 0;
+            for (let i = 0; i < 8; i++) {
+                if (distribution[i] > maxValue) maxValue = distribution[i];
+            }
+
+            // Fresh objects along the changed path so the graph re-renders;
+            // y is copied out of the shared buffer for the same reason.
+            const layout = Object.assign({}, figure.layout, {
+                yaxis: Object.assign({}, figure.layout.yaxis, {
+                    range: [0, maxValue * 1.1]
+                })
+            });
+            const trace = Object.assign({}, figure.data[0], {
+                y: Array.from(distribution)
+            });
+            return Object.assign({}, figure, {data: [trace], layout: layout});
+        },
+
+        format_states: function (distribution) {
+            return distribution.map((val, i) => `π${i+1} = ${val.toFixed(6)}`);
+        }
+    }
+});
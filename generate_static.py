@@ -1,189 +1,196 @@
 """
-Generate a standalone HTML page with the interactive visualization.
-This converts the Dash app into a static HTML file that can be hosted on GitHub Pages.
+Generate a static HTML page and stylesheet with the interactive visualization.
+This converts the Dash app into static files that can be hosted on GitHub Pages.
 """
 
+import gzip
 import os
+from pathlib import Path
+
+import brotli
+import csscompressor
+
+__all__ = ['generate_html', '_CSS', '_HTML']
+
+_CSS_RAW = """* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    padding: 2rem;
+    background: linear-gradient(135deg, #000000 0%, #444444 100%);
+    min-height: 100vh;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    background: white;
+    padding: 2rem;
+    border-radius: 12px;
+    box-shadow: 0 20px 60px rgba(0,0,0,0.3);
+}
+
+h1 {
+    color: #2d3748;
+    margin-bottom: 0.5rem;
+    font-size: 2rem;
+}
+
+.subtitle {
+    color: #718096;
+    margin-bottom: 2rem;
+    font-size: 1rem;
+}
+
+.controls {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+    gap: 1.5rem;
+    margin-bottom: 2rem;
+}
+
+.control-group {
+    background: #f7fafc;
+    padding: 1rem;
+    border-radius: 8px;
+    border: 1px solid #e2e8f0;
+}
+
+label {
+    display: block;
+    font-weight: 600;
+    color: #2d3748;
+    margin-bottom: 0.5rem;
+    font-size: 0.95rem;
+}
+
+input[type="range"] {
+    width: 100%;
+    height: 6px;
+    border-radius: 5px;
+    background: #cbd5e0;
+    outline: none;
+    -webkit-appearance: none;
+}
+
+input[type="range"]::-webkit-slider-thumb {
+    -webkit-appearance: none;
+    appearance: none;
+    width: 18px;
+    height: 18px;
+    border-radius: 50%;
+    background: #667eea;
+    cursor: pointer;
+    transition: all 0.2s;
+}
+
+input[type="range"]::-webkit-slider-thumb:hover {
+    background: #5568d3;
+    transform: scale(1.2);
+}
+
+input[type="range"]::-moz-range-thumb {
+    width: 18px;
+    height: 18px;
+    border-radius: 50%;
+    background: #667eea;
+    cursor: pointer;
+    border: none;
+}
+
+.value-display {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-top: 0.5rem;
+    font-size: 0.9rem;
+    color: #4a5568;
+}
+
+.current-value {
+    font-weight: bold;
+    color: #667eea;
+    font-size: 1rem;
+}
+
+#plot {
+    margin: 2rem 0;
+    border-radius: 8px;
+    overflow: hidden;
+    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+}
+
+.distribution-values {
+    background: #f7fafc;
+    padding: 1.5rem;
+    border-radius: 8px;
+    margin-top: 2rem;
+    border: 1px solid #e2e8f0;
+}
+
+.distribution-values h3 {
+    color: #2d3748;
+    margin-bottom: 1rem;
+}
+
+.values-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 0.75rem;
+}
+
+.value-item {
+    background: white;
+    padding: 0.75rem;
+    border-radius: 6px;
+    font-family: 'Courier New', monospace;
+    font-size: 0.9rem;
+    border-left: 3px solid #667eea;
+}
+
+.derived-params {
+    background: #edf2f7;
+    padding: 1rem;
+    border-radius: 8px;
+    margin-top: 1rem;
+    font-family: 'Courier New', monospace;
+    font-size: 0.9rem;
+    color: #2d3748;
+}
+
+.github-link {
+    text-align: center;
+    margin-top: 2rem;
+    padding-top: 2rem;
+    border-top: 2px solid #e2e8f0;
+}
+
+.github-link a {
+    color: #667eea;
+    text-decoration: none;
+    font-weight: 600;
+}
+
+.github-link a:hover {
+    text-decoration: underline;
+}
+"""
 
+# Served as a separate stylesheet so browsers can cache it across visits
+_CSS = csscompressor.compress(_CSS_RAW)
 
-def generate_html():
-    """Generate a standalone HTML page with interactive controls."""
-
-    html_content = """<!DOCTYPE html>
+_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Tsetlin Machine Literal Automaton Stationary Distribution</title>
     <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            padding: 2rem;
-            background: linear-gradient(135deg, #000000 0%, #444444 100%);
-            min-height: 100vh;
-        }
-
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            padding: 2rem;
-            border-radius: 12px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-        }
-
-        h1 {
-            color: #2d3748;
-            margin-bottom: 0.5rem;
-            font-size: 2rem;
-        }
-
-        .subtitle {
-            color: #718096;
-            margin-bottom: 2rem;
-            font-size: 1rem;
-        }
-
-        .controls {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 1.5rem;
-            margin-bottom: 2rem;
-        }
-
-        .control-group {
-            background: #f7fafc;
-            padding: 1rem;
-            border-radius: 8px;
-            border: 1px solid #e2e8f0;
-        }
-
-        label {
-            display: block;
-            font-weight: 600;
-            color: #2d3748;
-            margin-bottom: 0.5rem;
-            font-size: 0.95rem;
-        }
-
-        input[type="range"] {
-            width: 100%;
-            height: 6px;
-            border-radius: 5px;
-            background: #cbd5e0;
-            outline: none;
-            -webkit-appearance: none;
-        }
-
-        input[type="range"]::-webkit-slider-thumb {
-            -webkit-appearance: none;
-            appearance: none;
-            width: 18px;
-            height: 18px;
-            border-radius: 50%;
-            background: #667eea;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-
-        input[type="range"]::-webkit-slider-thumb:hover {
-            background: #5568d3;
-            transform: scale(1.2);
-        }
-
-        input[type="range"]::-moz-range-thumb {
-            width: 18px;
-            height: 18px;
-            border-radius: 50%;
-            background: #667eea;
-            cursor: pointer;
-            border: none;
-        }
-
-        .value-display {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-top: 0.5rem;
-            font-size: 0.9rem;
-            color: #4a5568;
-        }
-
-        .current-value {
-            font-weight: bold;
-            color: #667eea;
-            font-size: 1rem;
-        }
-
-        #plot {
-            margin: 2rem 0;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }
-
-        .distribution-values {
-            background: #f7fafc;
-            padding: 1.5rem;
-            border-radius: 8px;
-            margin-top: 2rem;
-            border: 1px solid #e2e8f0;
-        }
-
-        .distribution-values h3 {
-            color: #2d3748;
-            margin-bottom: 1rem;
-        }
-
-        .values-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 0.75rem;
-        }
-
-        .value-item {
-            background: white;
-            padding: 0.75rem;
-            border-radius: 6px;
-            font-family: 'Courier New', monospace;
-            font-size: 0.9rem;
-            border-left: 3px solid #667eea;
-        }
-
-        .derived-params {
-            background: #edf2f7;
-            padding: 1rem;
-            border-radius: 8px;
-            margin-top: 1rem;
-            font-family: 'Courier New', monospace;
-            font-size: 0.9rem;
-            color: #2d3748;
-        }
-
-        .github-link {
-            text-align: center;
-            margin-top: 2rem;
-            padding-top: 2rem;
-            border-top: 2px solid #e2e8f0;
-        }
-
-        .github-link a {
-            color: #667eea;
-            text-decoration: none;
-            font-weight: 600;
-        }
-
-        .github-link a:hover {
-            text-decoration: underline;
-        }
-    </style>
+    <link rel="stylesheet" href="style.css">
 </head>
 <body>
     <div class="container">
@@ -246,35 +253,108 @@ def generate_html():
     </div>
 
     <script>
-        // Computation functions (ported from Python)
-        function stationaryDistribution(s, py, ply, pnotl_noty) {
+        // Computation functions (ported from Python). stateCoefficients,
+        // normalise and stationaryDistribution must stay in sync with
+        // assets/automaton.js, which the Dash app uses.
+
+        // Buffers reused across updates, so dragging a slider allocates nothing
+        const terms = new Float64Array(8);
+        const coefficients = new Float64Array(8);
+        const states = Object.freeze(['π₁', 'π₂', 'π₃', 'π₄', 'π₅', 'π₆', 'π₇', 'π₈']);
+
+        // The plot is created once and then diffed with Plotly.react. Since y
+        // is the reused terms buffer, datarevision tells Plotly it changed.
+        let initialized = false;
+        let revision = 0;
+
+        // Every term factors as coefficient[i] * s^i, where the coefficient
+        // depends only on the three probabilities. Powers are written out as
+        // multiplications rather than Math.pow calls.
+        function stateCoefficients(py, ply, pnotl_noty, out) {
             const pnotly = 1.0 - ply;
             const pnoty = 1.0 - py;
             const base = ply * py + pnotl_noty * pnoty;
 
-            const terms = [
-                Math.pow(py, 4) * Math.pow(pnotly, 7),
-                Math.pow(py, 3) * Math.pow(pnotly, 6) * s * base,
-                Math.pow(py, 2) * Math.pow(pnotly, 5) * Math.pow(s, 2) * Math.pow(base, 2),
-                py * Math.pow(pnotly, 4) * Math.pow(s, 3) * Math.pow(base, 3),
-                Math.pow(pnotly, 3) * Math.pow(s, 4) * Math.pow(base, 4),
-                ply * Math.pow(pnotly, 2) * Math.pow(s, 5) * Math.pow(base, 4),
-                Math.pow(ply, 2) * pnotly * Math.pow(s, 6) * Math.pow(base, 4),
-                Math.pow(ply, 3) * Math.pow(s, 7) * Math.pow(base, 4)
-            ];
+            const py2 = py * py;
+            const pn2 = pnotly * pnotly;
+            const pn3 = pn2 * pnotly;
+            const pn4 = pn2 * pn2;
+            const b2 = base * base;
+            const b4 = b2 * b2;
+
+            out[0] = py2 * py2 * pn4 * pn3;
+            out[1] = py2 * py * pn3 * pn3 * base;
+            out[2] = py2 * pn4 * pnotly * b2;
+            out[3] = py * pn4 * b2 * base;
+            out[4] = pn3 * b4;
+            out[5] = ply * pn2 * b4;
+            out[6] = ply * ply * pnotly * b4;
+            out[7] = ply * ply * ply * b4;
+        }
 
-            const total = terms.reduce((a, b) => a + b, 0);
+        // Normalise buf[offset .. offset + 8) in place.
+        function normalise(buf, offset) {
+            let total = 0;
+            for (let i = 0; i < 8; i++) {
+                total += buf[offset + i];
+            }
 
             if (total === 0) {
-                return terms.map(() => 1.0 / terms.length);
+                for (let i = 0; i < 8; i++) {
+                    buf[offset + i] = 1.0 / 8;
+                }
+                return;
             }
 
             const alpha = 1.0 / total;
-            return terms.map(term => alpha * term);
+            for (let i = 0; i < 8; i++) {
+                buf[offset + i] *= alpha;
+            }
+        }
+
+        // Fills and returns the shared terms buffer.
+        function stationaryDistribution(s, py, ply, pnotl_noty) {
+            stateCoefficients(py, ply, pnotl_noty, terms);
+            let sPower = 1.0;
+            for (let i = 0; i < 8; i++) {
+                terms[i] *= sPower;
+                sPower *= s;
+            }
+            normalise(terms, 0);
+            return terms;
+        }
+
+        // Distributions for every step of the s slider at one probability
+        // triple, so dragging s is a table lookup.
+        const S_MIN = 1.0;
+        const S_STEP = 0.1;
+        const S_COUNT = 241;
+        const sTable = new Float64Array(S_COUNT * 8);
+        let sTableKey = null;
+
+        function sAxisTable(py, ply, pnotl_noty) {
+            const key = `${py.toFixed(2)},${ply.toFixed(2)},${pnotl_noty.toFixed(2)}`;
+            if (key === sTableKey) {
+                return sTable;
+            }
+
+            stateCoefficients(py, ply, pnotl_noty, coefficients);
+            for (let k = 0; k < S_COUNT; k++) {
+                const s = S_MIN + k * S_STEP;
+                let sPower = 1.0;
+                for (let i = 0; i < 8; i++) {
+                    sTable[k * 8 + i] = coefficients[i] * sPower;
+                    sPower *= s;
+                }
+                normalise(sTable, k * 8);
+            }
+
+            sTableKey = key;
+            return sTable;
         }
 
         // Update visualization
-        function updateVisualization() {
+        function updateVisualization(event) {
             const s = parseFloat(document.getElementById('s-slider').value);
             const ply = parseFloat(document.getElementById('ply-slider').value);
             const py = parseFloat(document.getElementById('py-slider').value);
@@ -287,8 +367,22 @@ def generate_html():
             document.getElementById('pnotl-value').textContent = pnotl_noty.toFixed(2);
 
             // Calculate distribution
-            const distribution = stationaryDistribution(s, py, ply, pnotl_noty);
-            const states = ['π₁', 'π₂', 'π₃', 'π₄', 'π₅', 'π₆', 'π₇', 'π₈'];
+            let distribution;
+            if (event && event.target.id === 's-slider') {
+                const k = Math.round((s - S_MIN) / S_STEP);
+                const table = sAxisTable(py, ply, pnotl_noty);
+                for (let i = 0; i < 8; i++) {
+                    terms[i] = table[k * 8 + i];
+                }
+                distribution = terms;
+            } else {
+                distribution = stationaryDistribution(s, py, ply, pnotl_noty);
+            }
+
+            let maxValue = 0;
+            for (let i = 0; i < 8; i++) {
+                if (distribution[i] > maxValue) maxValue = distribution[i];
+            }
 
             // Update plot
             const trace = {
@@ -318,22 +412,31 @@ def generate_html():
                 yaxis: {
                     title: 'Probability',
                     titlefont: { size: 14, color: '#4a5568' },
-                    range: [0, Math.max(...distribution) * 1.1]
+                    range: [0, maxValue * 1.1]
                 },
                 margin: { l: 60, r: 30, t: 60, b: 60 },
                 plot_bgcolor: '#ffffff',
-                paper_bgcolor: '#ffffff'
+                paper_bgcolor: '#ffffff',
+                datarevision: ++revision
             };
 
-            Plotly.newPlot('plot', [trace], layout, {
+            const config = {
                 responsive: true,
                 displayModeBar: false
-            });
+            };
+
+            if (initialized) {
+                Plotly.react('plot', [trace], layout, config);
+            } else {
+                Plotly.newPlot('plot', [trace], layout, config);
+                initialized = true;
+            }
 
             // Update distribution values
-            const listHtml = distribution.map((val, i) =>
-                `<div class="value-item">π${i+1} = ${val.toFixed(6)}</div>`
-            ).join('');
+            let listHtml = '';
+            for (let i = 0; i < 8; i++) {
+                listHtml += `<div class="value-item">π${i+1} = ${distribution[i].toFixed(6)}</div>`;
+            }
             document.getElementById('distribution-list').innerHTML = listHtml;
 
             // Update derived parameters
@@ -357,19 +460,32 @@ def generate_html():
 </body>
 </html>"""
 
-    return html_content
+
+def generate_html():
+    """Generate a standalone HTML page with interactive controls."""
+    return _HTML
+
 
 if __name__ == '__main__':
-    import os
+    docs = Path('docs')
 
     # Create docs directory
-    os.makedirs('docs', exist_ok=True)
+    os.makedirs(docs, exist_ok=True)
+
+    # Generate HTML and its stylesheet
+    assets = {
+        'index.html': generate_html(),
+        'style.css': _CSS,
+    }
+
+    for name, text in assets.items():
+        data = text.encode('utf-8')
 
-    # Generate HTML
-    html = generate_html()
+        # Write to file
+        (docs / name).write_bytes(data)
 
-    # Write to file
-    with open('docs/index.html', 'w', encoding='utf-8') as f:
-        f.write(html)
+        # Precompressed copies for hosts that serve a .gz/.br sibling directly
+        (docs / f'{name}.gz').write_bytes(gzip.compress(data, mtime=0))
+        (docs / f'{name}.br').write_bytes(brotli.compress(data, quality=11))
 
-    print("✅ Static site generated successfully in docs/index.html")
+    print("✅ Static site generated successfully in docs/index.html and docs/style.css")